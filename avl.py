@@ -62,75 +62,120 @@ class AVLTree(BinarySearchTree, Generic[K, I]):
             Attempts to insert an item into the tree, it uses the Key to insert
             it. After insertion, performs sub-tree rotation whenever it becomes
             unbalanced.
+            The insertion point is found iteratively, recording the path taken
+            so that the ancestors can be updated bottom-up afterwards.
             returns the new root of the subtree.
             :complexity best: O(CompK) inserts the item at the root.
             :complexity worst: O(CompK * D) inserting at the bottom of the tree
             where D is the depth of the tree
             CompK is the complexity of comparing the keys
         """
-        if current is None:  # base case: at the leaf
-            current = AVLTreeNode(key, item)
-            self.length += 1
-        elif key < current.key:
-            current.left = self.insert_aux(current.left, key, item)
-        elif key > current.key:
-            current.right = self.insert_aux(current.right, key, item)
-        else:  # key == current.key
-            raise ValueError('Inserting duplicate item')
-
-        # Update the height of parent node
-        current.height = 1 + max(self.get_height(current.left), self.get_height(current.right))
-
-        # Update number of children of the parent node
-        current.num_nodes_subtree = 1 + self.get_num_nodes_subtree(current.left) + self.get_num_nodes_subtree(current.right)
-
-        # Rebalance node if needed and return the new root of the subtree
-        return self.rebalance(current)
-
+        path = []
+        went_left = []
+
+        # descend to the leaf, remembering each node and the direction taken
+        while current is not None:
+            if key < current.key:
+                path.append(current)
+                went_left.append(True)
+                current = current.left
+            elif key > current.key:
+                path.append(current)
+                went_left.append(False)
+                current = current.right
+            else:  # key == current.key
+                raise ValueError('Inserting duplicate item')
+
+        self.length += 1
+        return self.retrace(path, went_left, AVLTreeNode(key, item), 1)
 
     def delete_aux(self, current: AVLTreeNode, key: K) -> AVLTreeNode:
         """
             Attempts to delete an item from the tree, it uses the Key to
             determine the node to delete. After deletion,
             performs sub-tree rotation whenever it becomes unbalanced.
+            The node is found iteratively, recording the path taken so that the
+            ancestors can be updated bottom-up afterwards.
             returns the new root of the subtree.
             :complexity best: O(CompK) deletes root item which does not have a left and/or a right node.
             :complexity worst: O(D) deletes item at the bottom of the tree
             where D is the depth of the tree
             CompK is the complexity of comparing the keys
         """
+        path = []
+        went_left = []
+        node = current
+
+        while True:
+            if node is None:  # key not found
+                raise ValueError('Deleting non-existent item')
+            elif key < node.key:
+                path.append(node)
+                went_left.append(True)
+                node = node.left
+            elif key > node.key:
+                path.append(node)
+                went_left.append(False)
+                node = node.right
+            else:  # we found our key => do actual deletion
+                break
+
+        if node.left is not None and node.right is not None:
+            # general case => copy the successor here and unlink the successor instead
+            path.append(node)
+            went_left.append(False)
+            succ = node.right
+            while succ.left is not None:
+                path.append(succ)
+                went_left.append(True)
+                succ = succ.left
+            node.key = succ.key
+            node.item = succ.item
+            node = succ
+
+        # node has at most one child, which takes its place
+        self.length -= 1
+        replacement = node.left if node.left is not None else node.right
+        return self.retrace(path, went_left, replacement, -1)
+
+    def retrace(self, path: list, went_left: list, current: AVLTreeNode, size_change: int) -> AVLTreeNode:
+        """
+            Re-links current as the child of the last node in path and walks
+            back up the path, updating the height and number of nodes of each
+            ancestor and rebalancing it.
+            went_left[i] tells whether current's subtree hangs to the left of path[i].
+            size_change is the number of nodes added (1) or removed (-1) below the
+            path. Rotations do not change how many nodes a subtree holds, so every
+            ancestor's count changes by exactly that amount.
+            returns the new root of the subtree rooted at path[0]
+            (or current if path is empty).
+            :complexity: O(D) where D is the length of path
+        """
+        for i in range(len(path) - 1, -1, -1):
+            parent = path[i]
+            if went_left[i]:
+                parent.left = current
+            else:
+                parent.right = current
+
+            left = parent.left
+            right = parent.right
+            left_height = left.height if left is not None else 0
+            right_height = right.height if right is not None else 0
+
+            # Update the height of parent node
+            parent.height = 1 + (left_height if left_height > right_height else right_height)
+
+            # Update number of children of the parent node
+            parent.num_nodes_subtree += size_change
+
+            # Rebalance node only if needed, its new root is re-linked on the next step
+            if -2 < right_height - left_height < 2:
+                current = parent
+            else:
+                current = self.rebalance(parent)
 
-        if current is None:  # key not found
-            raise ValueError('Deleting non-existent item')
-        elif key < current.key:
-            current.left = self.delete_aux(current.left, key)
-        elif key > current.key:
-            current.right = self.delete_aux(current.right, key)
-        else:  # we found our key => do actual deletion
-            if self.is_leaf(current):
-                self.length -= 1
-                return None
-            elif current.left is None:
-                self.length -= 1
-                return current.right
-            elif current.right is None:
-                self.length -= 1
-                return current.left
-
-            # general case => find a successor
-            succ = self.get_successor(current)
-            current.key = succ.key
-            current.item = succ.item
-            current.right = self.delete_aux(current.right, succ.key)
-
-        # Update the height of parent node
-        current.height = 1 + max(self.get_height(current.left), self.get_height(current.right))
-
-        # Update number of children of the parent node
-        current.num_nodes_subtree = 1 + self.get_num_nodes_subtree(current.left) + self.get_num_nodes_subtree(current.right)
-
-        # Rebalance node if needed and return the new root of the subtree
-        return self.rebalance(current)
+        return current
 
     def left_rotate(self, current: AVLTreeNode) -> AVLTreeNode:
         """
@@ -150,18 +195,27 @@ class AVLTree(BinarySearchTree, Generic[K, I]):
         """
         child = current.right
         center = child.left
+        l_tree = current.left
+        r_tree = child.right
 
         # Perform rotation
         child.left = current
         current.right = center
 
         # Update heights
-        current.height = 1 + max(self.get_height(current.left), self.get_height(current.right))
-        child.height = 1 + max(self.get_height(child.left), self.get_height(child.right))
+        l_height = l_tree.height if l_tree is not None else 0
+        center_height = center.height if center is not None else 0
+        r_height = r_tree.height if r_tree is not None else 0
+        current_height = 1 + (l_height if l_height > center_height else center_height)
+        current.height = current_height
+        child.height = 1 + (current_height if current_height > r_height else r_height)
 
         # Update number of children
-        current.num_nodes_subtree = 1 + self.get_num_nodes_subtree(current.left) + self.get_num_nodes_subtree(current.right)
-        child.num_nodes_subtree = 1 + self.get_num_nodes_subtree(child.left) + self.get_num_nodes_subtree(child.right)
+        # the rotated sub-tree holds the same nodes, so the new root takes over the old root's count
+        child.num_nodes_subtree = current.num_nodes_subtree
+        l_size = l_tree.num_nodes_subtree if l_tree is not None else 0
+        center_size = center.num_nodes_subtree if center is not None else 0
+        current.num_nodes_subtree = 1 + l_size + center_size
 
         # Return new root
         return child
@@ -184,18 +238,27 @@ class AVLTree(BinarySearchTree, Generic[K, I]):
         """
         child = current.left
         center = child.right
+        l_tree = child.left
+        r_tree = current.right
 
         # Perform rotation
         child.right = current
         current.left = center
 
         # Update heights
-        current.height = 1 + max(self.get_height(current.left), self.get_height(current.right))
-        child.height = 1 + max(self.get_height(child.left), self.get_height(child.right))
+        l_height = l_tree.height if l_tree is not None else 0
+        center_height = center.height if center is not None else 0
+        r_height = r_tree.height if r_tree is not None else 0
+        current_height = 1 + (center_height if center_height > r_height else r_height)
+        current.height = current_height
+        child.height = 1 + (l_height if l_height > current_height else current_height)
 
         # Update number of children
-        current.num_nodes_subtree = 1 + self.get_num_nodes_subtree(current.left) + self.get_num_nodes_subtree(current.right)
-        child.num_nodes_subtree = 1 + self.get_num_nodes_subtree(child.left) + self.get_num_nodes_subtree(child.right)
+        # the rotated sub-tree holds the same nodes, so the new root takes over the old root's count
+        child.num_nodes_subtree = current.num_nodes_subtree
+        center_size = center.num_nodes_subtree if center is not None else 0
+        r_size = r_tree.num_nodes_subtree if r_tree is not None else 0
+        current.num_nodes_subtree = 1 + center_size + r_size
 
         # Return new root
         return child
@@ -211,16 +274,22 @@ class AVLTree(BinarySearchTree, Generic[K, I]):
             returns the new root of the subtree.
             :complexity: O(1)
         """
-        if self.get_balance(current) >= 2:
-            child = current.right
-            if self.get_height(child.left) > self.get_height(child.right):
-                current.right = self.right_rotate(child)
+        left = current.left
+        right = current.right
+        balance = (right.height if right is not None else 0) - (left.height if left is not None else 0)
+
+        if balance >= 2:
+            inner = right.left
+            outer = right.right
+            if (inner.height if inner is not None else 0) > (outer.height if outer is not None else 0):
+                current.right = self.right_rotate(right)
             return self.left_rotate(current)
 
-        if self.get_balance(current) <= -2:
-            child = current.left
-            if self.get_height(child.right) > self.get_height(child.left):
-                current.left = self.left_rotate(child)
+        if balance <= -2:
+            inner = left.right
+            outer = left.left
+            if (inner.height if inner is not None else 0) > (outer.height if outer is not None else 0):
+                current.left = self.left_rotate(left)
             return self.right_rotate(current)
 
         return current
@@ -240,6 +309,12 @@ class AVLTree(BinarySearchTree, Generic[K, I]):
         if k > self.get_num_nodes_subtree(self.root) or k < 1:  # key not found
             raise ValueError('k cannot be greater than the number of elements in the tree and must be greater than 1')
 
+        # the largest and smallest values only need a walk down one side, no counting
+        if k == 1:
+            return self.get_maximal(self.root)
+        if k == self.root.num_nodes_subtree:
+            return self.get_minimal(self.root)
+
         return self.kth_largest_aux(k, self.root)
 
     def kth_largest_aux(self, k: int, current: AVLTreeNode) -> AVLTreeNode:
@@ -251,19 +326,98 @@ class AVLTree(BinarySearchTree, Generic[K, I]):
         :complexity best: O(1) the kth largest value is the root node
         :complexity worst: O(log(N)) the kth largest value is at the bottom of the tree
         where N is the total number of nodes in the tree
-        Each iteration of kth_largest_in_subtree determines whether the kth largest value is
+        Each iteration of the loop determines whether the kth largest value is
         the root or if it is in the left or right subtree. So, each iteration divides the subtree
         in half, giving a logN complexity.
         Note: the tree is always balanced - an unbalanced tree would not have this complexity
         """
-        num_right_tree_nodes = self.get_num_nodes_subtree(current.right)
-
-        # the kth value is always the one with its right subtree elements == k-1
-        if k == num_right_tree_nodes + 1:
-            return current
-        # if the num elements in the right subtree >= k, move to the right subtree
-        elif k <= num_right_tree_nodes:
-            return self.kth_largest_aux(k, current.right)
-        # otherwise k is in the left subtree. Move to that subtree and update k
-        elif k > (num_right_tree_nodes + 1):
-            return self.kth_largest_aux(k - num_right_tree_nodes - 1, current.left)
+        while True:
+            right = current.right
+            num_right_tree_nodes = right.num_nodes_subtree if right is not None else 0
+
+            # the kth value is always the one with its right subtree elements == k-1
+            if k == num_right_tree_nodes + 1:
+                return current
+            # if the num elements in the right subtree >= k, move to the right subtree
+            elif k <= num_right_tree_nodes:
+                current = right
+            # otherwise k is in the left subtree. Move to that subtree and update k
+            else:
+                k -= num_right_tree_nodes + 1
+                current = current.left
+
+    def build_from_sorted(self, pairs: list) -> None:
+        """
+            Replaces the contents of the tree with the (key, item) pairs given.
+            The pairs must be sorted by key in ascending order. The middle pair of
+            every range becomes the root of its subtree, so the resulting tree is
+            balanced without performing any rotations.
+            :raises ValueError: if the keys are not unique and in ascending order
+            :complexity: O(N * CompK) where N is the length of pairs
+            CompK is the complexity of comparing the keys
+        """
+        for i in range(1, len(pairs)):
+            if not pairs[i - 1][0] < pairs[i][0]:
+                raise ValueError('Keys must be unique and sorted in ascending order')
+
+        self.root = self.build_from_sorted_aux(pairs, 0, len(pairs) - 1)
+        self.length = len(pairs)
+
+    def build_from_sorted_aux(self, pairs: list, lo: int, hi: int) -> AVLTreeNode:
+        """
+            Builds a balanced subtree from pairs[lo..hi] (inclusive).
+            returns the root of the subtree, or None if the range is empty.
+            :complexity: O(hi - lo)
+        """
+        if lo > hi:
+            return None
+
+        mid = (lo + hi) // 2
+        current = AVLTreeNode(pairs[mid][0], pairs[mid][1])
+        current.left = self.build_from_sorted_aux(pairs, lo, mid - 1)
+        current.right = self.build_from_sorted_aux(pairs, mid + 1, hi)
+
+        current.height = 1 + max(self.get_height(current.left), self.get_height(current.right))
+        current.num_nodes_subtree = 1 + self.get_num_nodes_subtree(current.left) + self.get_num_nodes_subtree(current.right)
+        return current
+
+    def bulk_insert(self, pairs: list) -> None:
+        """
+            Inserts all the (key, item) pairs given, in any order.
+            When the batch is at least as large as the tree, the heights and sizes
+            are not maintained insertion by insertion. Instead, the pairs already
+            in the tree and the new ones are merged in key order and the tree is
+            rebuilt balanced in one pass (see build_from_sorted).
+            Smaller batches are checked first and then inserted one at a time.
+            Either way, the tree is left unchanged if a ValueError is raised.
+            :raises ValueError: if a key is repeated or already in the tree
+            :complexity: O(B * log(B) + N) when rebuilding, O(B * log(N + B)) otherwise
+            where B is the length of pairs and N is the number of nodes in the tree
+            (comparing keys assumed to be constant)
+        """
+        if len(pairs) < self.length:
+            # check every key before inserting any, so that a bad batch leaves the tree untouched
+            keys = sorted(pair[0] for pair in pairs)
+            for i in range(len(keys)):
+                if (i > 0 and not keys[i - 1] < keys[i]) or keys[i] in self:
+                    raise ValueError('Inserting duplicate item')
+            for key, item in pairs:
+                self[key] = item
+            return
+
+        # collect the pairs already in the tree in key order
+        merged = []
+        stack = []
+        current = self.root
+        while current is not None or stack:
+            while current is not None:
+                stack.append(current)
+                current = current.left
+            current = stack.pop()
+            merged.append((current.key, current.item))
+            current = current.right
+
+        # both runs are sorted, so sorting the concatenation only merges them
+        merged.extend(sorted(pairs, key=lambda pair: pair[0]))
+        merged.sort(key=lambda pair: pair[0])
+        self.build_from_sorted(merged)
@@ -73,6 +73,25 @@ class BinarySearchTree(Generic[K, I]):
         """
         return self.root is None
 
+    def clear(self) -> None:
+        """
+            Empties the tree.
+            The nodes are unlinked one by one with an explicit stack, so releasing
+            a deep tree never recurses from one node into the next.
+            :complexity: O(N) where N is the number of nodes in the tree
+        """
+        stack = [self.root]
+        while stack:
+            current = stack.pop()
+            if current is not None:
+                stack.append(current.left)
+                stack.append(current.right)
+                current.left = None
+                current.right = None
+
+        self.root = None
+        self.length = 0
+
     def __len__(self) -> int:
         """ Returns the number of nodes in the tree. """
 
@@ -207,6 +226,15 @@ class BinarySearchTree(Generic[K, I]):
             current = current.left
         return current
 
+    def get_maximal(self, current: TreeNode) -> TreeNode:
+        """
+            Get a node having the largest key in the current sub-tree.
+            :complexity: O(D), where D is the depth of the subtree's right-most branch
+        """
+        while current.right:
+            current = current.right
+        return current
+
     def is_leaf(self, current: TreeNode) -> bool:
         """ Simple check whether or not the node is a leaf. """
 
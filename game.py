@@ -11,9 +11,9 @@ __modified__ = '21/05/2020'
 __since__ = '14/05/2020'
 
 # ^ In case you aren't on Python 3.10
+from bisect import bisect_left
 from avl import AVLTree
 from hash_table import LinearProbePotionTable
-from linked_stack import LinkedStack
 from potion import Potion
 from random_gen import RandomGen
 
@@ -32,10 +32,10 @@ class Game:
         and balanced, AVL trees are able to insert, delete and find the kth most expensive potion
         in logarithmic time. Thus, it is the chosen data type.
 
-        To calculate the maximum money to be made per day, Stack and AVL tree data types have been implemented.
-        The AVL tree allows for the calculated trades to be stored in sorted order efficiently since insertion
-        is logarithmic time. The Stack data type allows for quick constant time access to the next trade the
-        player should make.
+        To calculate the maximum money to be made per day, the possible trades are merged in a dictionary
+        (keyed by profit per dollar) and then sorted once into a list, most profitable first. The trades do not
+        change between days, so running totals of their spend and profit are built once, and each day binary
+        searches the spend totals for the first trade the player cannot fully afford.
     """
 
     def __init__(self, seed=0) -> None:
@@ -46,6 +46,8 @@ class Game:
         self.rand = RandomGen(seed=seed)
         # Potion Hash Table (Contains all possible potions)
         self.potion_table = LinearProbePotionTable(100)
+        # Buying price of each potion by name (read-only copy of the prices in potion_table)
+        self.potion_prices = {}
         # Potion Binary Search Tree (Contains potions that are purchasable)
         self.potion_inventory = AVLTree()
 
@@ -53,6 +55,9 @@ class Game:
         """
         Initialises the Hash Table. Uses the hash_table ADT so that accessing potions can be done in constant time
         given that the name of the potion is known. This also enables inserting potions to be in constant time.
+        The buying price of each potion is also recorded by name, since it is the only potion data needed when
+        adding to the inventory and solving the game. Those lookups then cost a single dictionary access
+        instead of a probe of the hash table.
 
         :complexity: O(len(potion_data)* insert) = O(C), where C is the length of potion_data list
         O(insert) is assumed to be in constant time
@@ -61,20 +66,28 @@ class Game:
         """
 
         self.potion_table = LinearProbePotionTable(len(potion_data))
+        self.potion_prices = {}
         for potion in potion_data:
             # Add all the potions and hash the name of each potion
             self.potion_table[potion[1]] = Potion.create_empty(potion[0], potion[1], potion[2])
+            self.potion_prices[potion[1]] = potion[2]
 
     def add_potions_to_inventory(self, potion_name_amount_pairs: list[tuple[str, float]]) -> None:
         """
         Adds the potion tuples that are being sold to AVL Tree. Since AVL trees remain sorted and balanced,
         insertion, searches and deletion can be performed with logarithmic complexity.
+        The potions are added as one batch: if there are at least as many new potions as potions already in the
+        inventory, the tree is rebuilt balanced from all of them in price order, which avoids all of the
+        rotations that inserting them one by one would cause.
 
         :complexity: O(C * log(N))
         where C is the length of potion_name_amount_pairs
               N is the number of potions provided in set_total_potion_data
 
-        The complexity for this method is given by O(C * insert) since it always iterates through each item in
+        Looking up the price of each potion is O(C).
+        When the inventory is rebuilt, the new potions are sorted in O(C * log(C)) and the balanced tree is built
+        in O(C), since the inventory held no more than C potions beforehand.
+        Otherwise, the complexity is given by O(C * insert) since it always iterates through each item in
         potion_name_amount_pairs and inserts each potion into the inventory.
         The inventory is constructed using an AVL tree as described above, so insert complexity is log(N).
         Thus, overall complexity is O(C * log(N))
@@ -83,48 +96,67 @@ class Game:
         :return: None
         """
 
-        for potion in potion_name_amount_pairs:
-            potion_price = self.potion_table[potion[0]].buy_price
-            self.potion_inventory[potion_price] = potion
+        priced_potions = [(self.potion_prices[potion[0]], potion) for potion in potion_name_amount_pairs]
+        self.potion_inventory.bulk_insert(priced_potions)
 
     def choose_potions_for_vendors(self, num_vendors: int) -> list:
         """
         Chooses the potions that each vendor will offer based on the random number generator and returns them as a list.
         Uses the random_gen file to generate random numbers.
 
-        :complexity: O(C * log(N))
+        Each vendor picks the pth most expensive potion among the potions not chosen yet. Rather than deleting
+        chosen potions from the inventory and putting them back afterwards, the ranks already chosen are kept in
+        a sorted list and p is mapped to its rank in the full inventory by skipping over them. The inventory is
+        never modified.
+
+        :complexity: O(C * (log(N) + C))
         where C is num_vendors
               N is number of potions provided in set_total_potion_data
 
         Since this method always iterates through each integer in the range of num_vendors and for each iteration
-        it deletes and finds the kth most expensive potion from inventory and adds it to a list, the complexity
-        is given by O(C*(kth_largest + delete + append)).
-        The AVL tree used to store the inventory allows for deletion in log(N) complexity and finding the kth
-        most expensive potion too.
+        it maps the random number to a rank, finds the kth most expensive potion from inventory and adds it to a
+        list, the complexity is given by O(C*(map rank + insert rank + kth_largest + append)).
+        Mapping the rank is a binary search over the chosen ranks, which is log(C).
+        Inserting the rank into the sorted list of chosen ranks shifts at most C elements.
+        The AVL tree used to store the inventory allows for finding the kth most expensive potion in log(N).
         see AVLTree kth_largest_aux(self, k: int, current: AVLTreeNode) -> AVLTreeNode
         Appending a potion to the end of potion_sell_list is done in constant time.
-        Therefore, O(C*(kth_largest + delete + append)) = O(C*(log(N) + log(N) + 1)) = O(C*log(N))
+        Therefore, O(C*(map rank + insert rank + kth_largest + append)) = O(C*(log(C) + C + log(N) + 1))
+            = O(C*(log(N) + C)) since C <= N.
+        The shifting is a single block move of references, which is far cheaper than the deletions and
+        re-insertions (with their rotations) it replaces.
 
         :param num_vendors: Number of vendors
         :return: list of selling potions
         """
 
         potion_sell_list = []
+        # ranks (in the full inventory) of the potions already chosen, in ascending order
+        chosen_ranks = []
+        number_of_potions = len(self.potion_inventory)
         # For every vendor, pick a random kth-largest potion
         for i in range(num_vendors):
-            # Choose a random number between 0 and the number of potions remaining in the inventory
-            number_to_choose = len(self.potion_inventory)
-            # Select a random number between 0 to the number of potions remaining in the inventory
-            p = self.rand.randint(number_to_choose)
+            # Select a random number between 1 and the number of potions not chosen yet
+            p = self.rand.randint(number_of_potions - i)
+
+            # Find how many chosen ranks come before the pth potion not chosen yet: O(log(C))
+            # chosen_ranks[mid] is preceded by chosen_ranks[mid] - mid - 1 unchosen potions,
+            # so it comes before the pth unchosen potion when that count is less than p
+            lo = 0
+            hi = len(chosen_ranks)
+            while lo < hi:
+                mid = (lo + hi) // 2
+                if chosen_ranks[mid] - mid <= p:
+                    lo = mid + 1
+                else:
+                    hi = mid
+            rank = p + lo
+            chosen_ranks.insert(lo, rank)
+
             # Get the potion from inventory: O(log(N))
-            potion = self.potion_inventory.kth_largest(p)
+            potion = self.potion_inventory.kth_largest(rank)
             # Append the potion to list: O(append)
             potion_sell_list.append(potion.item)
-            # Delete the potion from inventory: O(log(N))
-            del self.potion_inventory[potion.key]
-
-        # put all potions back into inventory
-        self.add_potions_to_inventory(potion_sell_list)
 
         return potion_sell_list
 
@@ -136,9 +168,12 @@ class Game:
         This solution consists of two main sections: Determining and storing possible trades sorted by profit, and
         calculating how much the player can make per day.
 
-        1) An AVL tree is used to store the possible trades since it inserts in logarithmic time and maintains them
-        in sorted order.
-        The corresponding potion in potion_table is found for each potion in potion_valuations.
+        1) A dictionary keyed by profit per dollar is used to collect the possible trades, merging trades that
+        have the same profit per dollar in constant time. Merging adds up their maximum money spent: every dollar
+        spent on either trade earns the same, and the player always finishes one before moving to a less
+        profitable one, so the merged trade gives exactly the same earnings as the two separate trades.
+        The trades are then sorted once, most profitable first.
+        The buying price of each potion in potion_valuations is found from the potion data.
         The profit made per dollar spent is calculated.
         This is done as opposed to profit per litre since it takes into account of how many litres can be bought and
         sold during the trade.
@@ -149,33 +184,31 @@ class Game:
         If player has $6 starting money, they can buy 2L of Potion 1 or 6L of Potion 2 (infinite supply assumed)
         Potion 1 money made = 2L * $2/L = $4
         Potion 2 money made = 6L * $1/L = $6
-        So, the profit stored in the AVL Tree is    (sell price - buy price)/buy price
-        The maximum amount made from the trade is also needed, so it is stored with profit in the AVL tree.
-
-        2) Each day the possible trades are stored into a Stack data type since it allows quick access to the most
-        profitable trade. The player spends as much money as they can on the current most profitable trade and when
-        their money is out, that day is over.
+        So, the trades are keyed by    (sell price - buy price)/buy price
+        The maximum amount of money that can be spent on the trade is also needed, so it is stored with the profit.
+
+        2) The player spends as much money as they can on the current most profitable trade and when their money
+        is out, that day is over. The trades never change between days, so running totals of the money needed to
+        complete the first j trades, and the profit they make, are computed once. Each day then binary searches
+        those totals for the first trade the player cannot complete: every trade before it is done in full and
+        the money left over is spent on it.
         ----------------------------------------------------------------------------------------------------------
 
-        :complexity: O(N * log(N) + M * N)
+        :complexity: O((N + M) * log(N))
         where N is the length of potion_valuations
               M is the length of starting_money
 
-        Since the first section of the solution iterates through potion_valuations and gets the data from the
-        hash table, accesses the potion from the inventory, checks if the trade is in the trades AVL tree, and
-        possibly deletes the trade from the AVL tree, it has complexity
-        O(N * (access hash + access tree + contains + delete)) = O(N * (1 + log(N) + log(N) + log(N)))
+        Since the first section of the solution iterates through potion_valuations and gets the price of the
+        potion, accesses the potion from the inventory and merges the trade into the dictionary, then sorts
+        the trades once, it has complexity
+        O(N * (access price + access tree + dictionary update) + sort) = O(N * (1 + log(N) + 1) + N * log(N))
          = O(N * log(N))
 
-        The second section always iterates through stating_money and for each iteration puts all trades into
-        a stack and pops each item off the stack one by one to complete calculations. Therefore, it has complexity
-        O(M * (tree traversal + put items in stack + go through stack))
-        The tree traversal always passes through each link twice, so it has complexity O(2N)
-        pushing and popping every trade into/out of the stack has complexity O(N) each since it visits each element.
-        So, O(M * (tree traversal + put items in stack + go through stack)) = O(M * (2N + N + N))
-            = O(M * N)
+        The second section computes the running totals once, which is O(N), then always iterates through
+        starting_money and for each iteration binary searches the running totals. Therefore, it has complexity
+        O(N + M * binary search) = O(N + M * log(N))
 
-        All together, the complexity is O(section1 + section2) = O(N * log(N) + M * N)
+        All together, the complexity is O(section1 + section2) = O(N * log(N) + M * log(N)) = O((N + M) * log(N))
 
         ----------------------------------------------------------------------------------------------------------
 
@@ -184,14 +217,15 @@ class Game:
         :return: list of optimal profit for each starting money value
         """
         results = []
-        profits_tree = AVLTree()
+        # maps profit_per_dollar -> maximum money that can be spent on that trade
+        trades_by_profit = {}
 
         # iterate through each potion
         for potion in potion_valuations:
-            # get the potion data from potion data hash table
-            potion_vendor_price = self.potion_table[potion[0]].buy_price
+            # get the buying price recorded from the potion data
+            potion_vendor_price = self.potion_prices[potion[0]]
             # To get optimal trades, base them on how much you can earn per dollar spent
-            # So, possible trades will be stored in AVLTree based on profit_per_dollar
+            # So, possible trades will be keyed on profit_per_dollar
             # This is done by ($(sell)/L - $(spend)/L) / $(spend)/L
             #                = ∂$/L / $(spend)/L    => or ∂$/L * L/$(spend)
             #                = ∂$/$(spend)     "the money earned per dollar spent"
@@ -204,40 +238,40 @@ class Game:
 
             # Only add in positive profits
             if profit_per_dollar > 0:
-                # BST can only have unique nodes. So, if two potions have the same profit per dollar, sum them
+                # If two potions have the same profit per dollar, sum them
                 # This can be done since they are now essentially the same
-                if profit_per_dollar in profits_tree:
-                    previous_max_money_spend = profits_tree[profit_per_dollar][1]
-                    del profits_tree[profit_per_dollar]
-                    profits_tree[profit_per_dollar] = [profit_per_dollar, max_money_spend + previous_max_money_spend]
-                else:
-                    profits_tree[profit_per_dollar] = [profit_per_dollar, max_money_spend]
-
-        # Play each day                         # O(M * (N + N)) = O(M * N)
-        for i in range(len(starting_money)):  # O(M)
-            # iterate through AVL Tree inorder and put in Stack
-            profits_stack = LinkedStack()
-            iterable = iter(profits_tree)
-            for j in range(len(profits_tree)):  # O(N) since each link is passed twice
-                profits_stack.push(next(iterable))
+                # (a single lookup both finds any previous trade and merges into it)
+                trades_by_profit[profit_per_dollar] = trades_by_profit.get(profit_per_dollar, 0) + max_money_spend
+
+        # sort the trades once, most profitable first: O(N * log(N))
+        trades = sorted(trades_by_profit.items(), reverse=True)
+
+        # running totals over the sorted trades: the money needed to complete trades[0..j]
+        # and the profit made by completing them                # O(N)
+        total_spend = []
+        total_profit = []
+        money_spent = 0
+        profit_made = 0
+        for profit_per_dollar, max_money_spend in trades:
+            money_spent += max_money_spend
+            profit_made += profit_per_dollar * max_money_spend
+            total_spend.append(money_spent)
+            total_profit.append(profit_made)
+
+        # Play each day                         # O(M * log(N))
+        for player_money in starting_money:  # O(M)
+            # the first trade the player doesn't have enough money to complete: O(log(N))
+            j = bisect_left(total_spend, player_money)
 
-            player_money = starting_money[i]
             # earnings always starts with the money we start with
             earnings = player_money
-
-            # start from top of stack (most profitable), going down
-            for k in range(len(profits_stack)):  # O(N)
-                trade = profits_stack.pop()  # O(1)
-
-                # if the player doesn't have enough for the whole trade,
-                # do their maximum and finish the day
-                if player_money <= trade[1]:
-                    earnings += player_money * trade[0]
-                    break
-
-                # They can do the whole trade. Then move on to the next best one
-                else:
-                    earnings += trade[0] * trade[1]
-                    player_money = player_money - trade[1]
+            money_left = player_money
+            # every trade before j is done in full
+            if j > 0:
+                earnings += total_profit[j - 1]
+                money_left = player_money - total_spend[j - 1]
+            # do the maximum of trade j with the rest and finish the day
+            if j < len(trades):
+                earnings += money_left * trades[j][0]
             results.append(earnings)
         return results
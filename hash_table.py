@@ -8,9 +8,10 @@ __docformat__ = 'reStructuredText'
 __modified__ = '21/05/2020'
 __since__ = '14/05/2020'
 
+import math
+import sys
 from potion import Potion
-from primes import largest_prime
-from referential_array import ArrayR
+from primes import smallest_prime
 from typing import TypeVar, Generic
 T = TypeVar('T')
 
@@ -23,41 +24,50 @@ class LinearProbePotionTable(Generic[T]):
 
     attributes:
         count: number of elements in the hash table
-        table: used to represent our internal array
+        table: used to represent our internal array, holds the key stored in each position (None if empty)
+        table_data: holds the data stored with the key in the same position of table
         table_size: current size of the hash table
+
+    Keys and data are kept in separate arrays so that probing only has to read the keys.
+
+    Unless a size is given, the table size is the smallest prime that keeps max_potions
+    entries at no more than TARGET_LOAD of the table.
     """
 
+    # Maximum load factor of a table sized from max_potions. Linear probing stays cheap
+    # up to a load factor of about 0.7 and degrades sharply past ~0.85, while a sparser
+    # table spreads the same entries over more memory. Tune this to trade space for
+    # shorter probe chains.
+    TARGET_LOAD = 0.7
+
     def __init__(self, max_potions: int, good_hash: bool=True, tablesize_override: int=-1) -> None:
         # Statistic setting
         self.conflict_count = 0
         self.probe_max = 0
         self.probe_total = 0
-        self.hash_choice = good_hash
+        # the choice is fixed, so pick the hash function once rather than on every hash
+        self.hash_function = Potion.good_hash if good_hash else Potion.bad_hash
         if tablesize_override == -1:
-            self.initalise_with_tablesize(largest_prime(max_potions * 2))
+            # smallest prime >= max_potions / TARGET_LOAD, so the table is at most TARGET_LOAD full
+            self.initalise_with_tablesize(smallest_prime(math.ceil(max_potions / self.TARGET_LOAD)))
         else:
             self.initalise_with_tablesize(tablesize_override)
 
     def hash(self, potion_name: str) -> int:
         """
         Hashes a string based on the choice of hash function
+        (good or bad, bound to hash_function when the table is created)
         :param potion_name: name of potion as a string
         :return: integer
         """
-
-        if self.hash_choice:
-            # Good Hash Function
-            return Potion.good_hash(potion_name, self.table_size)
-        else:
-            # Bad Hash Function
-            return Potion.bad_hash(potion_name, self.table_size)
+        return self.hash_function(potion_name, self.table_size)
 
     def statistics(self) -> tuple:
         """
         Good Hash Function:
         Good hash function takes the ASCII value of each character in the string and uses noise values to create a
-        pseudo random value. Since the hash table always has double the space of the inputs, there is a random and
-        low chance of conflicts. Therefore, conflict count does not increase as table size increases.
+        pseudo random value. Since the hash table is sized so that it is at most TARGET_LOAD full, there is a random
+        and low chance of conflicts. Therefore, conflict count does not increase as table size increases.
 
         The longest probe length will also be random since the input string will hash a random value, probe chains
         are expected to be less than the bad hash function and will not increase as the table size increases.
@@ -101,32 +111,38 @@ class LinearProbePotionTable(Generic[T]):
         """
         position = self.hash(key)  # get the position using hash
 
-        if is_insert and self.is_full():
+        table_size = self.table_size
+        if is_insert and self.count == table_size:  # table is full
             raise KeyError(key)
 
-        checked = True
-        probe = []
-
-        for _ in range(len(self.table)):  # start traversing
-            if self.probe_max < len(probe):
-                self.probe_max = len(probe)
-            if self.table[position] is None:  # found empty slot
-                if is_insert:
-                    return position
-                else:
-                    raise KeyError(key)  # so the key is not in
-            elif self.table[position][0] == key:  # found key
-                return position
-            else:  # there is something but not the key, try next
-                if checked:
-                    self.conflict_count += 1
-                    checked = False
-                probe.append(position)
-                self.probe_total += 1
-
-                position = (position + 1) % len(self.table)
-
-        raise KeyError(key)
+        table = self.table
+        start = position
+        steps = 0  # length of this probe chain
+        found = True
+
+        while True:  # start traversing
+            table_key = table[position]
+            if table_key is None or table_key == key:  # found empty slot or key
+                break
+            # there is something but not the key, try next
+            steps += 1
+            position = (position + 1) % table_size
+            if position == start:  # wrapped around to where we started
+                found = False
+                break
+
+        # update the statistics once, now that the length of the chain is known
+        if steps > 0:
+            self.conflict_count += 1
+            self.probe_total += steps
+            if steps > self.probe_max:
+                self.probe_max = steps
+
+        if not found:  # searched the entire table
+            raise KeyError(key)
+        if table[position] is None and not is_insert:
+            raise KeyError(key)  # so the key is not in
+        return position
         
     def __contains__(self, key: str) -> bool:
         """
@@ -147,7 +163,7 @@ class LinearProbePotionTable(Generic[T]):
         :raises KeyError: when the item doesn't exist
         """
         position = self.__linear_probe(key, False)
-        return self.table[position][1]
+        return self.table_data[position]
 
     def __setitem__(self, key: str, data: T) -> None:
         """
@@ -155,22 +171,26 @@ class LinearProbePotionTable(Generic[T]):
         :see: #self.__linear_probe(key: str, is_insert: bool)
         :see: #self.__contains__(key: str)
         """
-        if len(self) == len(self.table) and key not in self:
+        if self.count == self.table_size and key not in self:
             raise ValueError("Cannot insert into a full table.")
         position = self.__linear_probe(key, True)
 
         if self.table[position] is None:
             self.count += 1
-        self.table[position] = (key, data)
+            # interned, so looking up the same name again compares equal by identity straight away
+            self.table[position] = sys.intern(key)
+        self.table_data[position] = data
 
     def initalise_with_tablesize(self, tablesize: int) -> None:
         """
         Initialise a new array, with table size given by tablesize.
+        A plain list is used so that probing indexes it directly, without a method call per slot.
         Complexity: O(n), where n is len(tablesize)
         """
         self.count = 0
         self.table_size = tablesize
-        self.table = ArrayR(tablesize)
+        self.table = [None] * tablesize
+        self.table_data = [None] * tablesize
 
     def is_empty(self):
         """
@@ -184,7 +204,7 @@ class LinearProbePotionTable(Generic[T]):
         Returns whether the hash table is full
         :complexity: O(1)
         """
-        return self.count == len(self.table)
+        return self.count == self.table_size
 
     def insert(self, key: str, data: T) -> None:
         """
@@ -199,8 +219,7 @@ class LinearProbePotionTable(Generic[T]):
         :complexity: O(N) where N is the table size
         """
         result = ""
-        for item in self.table:
-            if item is not None:
-                (key, value) = item
+        for key, value in zip(self.table, self.table_data):
+            if key is not None:
                 result += "(" + str(key) + "," + str(value) + ")\n"
         return result
@@ -13,6 +13,8 @@ __docformat__ = 'reStructuredText'
 class ListNode(Generic[T]):
     """ Simple linked node. It contains an item and has a reference to next node. """
 
+    __slots__ = ('item', 'next')
+
     def __init__(self, item: T = None) -> None:
         """ Node initialiser. """
         self.item = item
@@ -21,6 +23,8 @@ class ListNode(Generic[T]):
 class TreeNode(Generic[K, I]):
     """ Node class represent BST nodes. """
 
+    __slots__ = ('key', 'item', 'left', 'right')
+
     def __init__(self, key: K, item: I = None) -> None:
         """
             Initialises the node with a key and optional item
@@ -44,8 +48,12 @@ class TreeNode(Generic[K, I]):
 class AVLTreeNode(TreeNode, Generic[K, I]):
     """ Node class for AVL trees.
         Objects of this class have an additional variable - height.
+        Nodes use a fixed attribute layout (no per-node __dict__) since every
+        insert, delete and rotation reads and writes these fields.
     """
 
+    __slots__ = ('height', 'num_nodes_subtree')
+
     def __init__(self, key: K, item: I = None) -> None:
         """
             Initialises the node with a key and optional item
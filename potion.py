@@ -5,6 +5,10 @@ __author__ = 'Ze Chong, Daniel Ding and Maily Butel'
 
 from primes import largest_prime
 
+# good_hash constants, computed once at import rather than on every hash
+GOOD_HASH_NOISE = largest_prime(1000)
+GOOD_HASH_BASE = largest_prime(5000)
+
 
 class Potion:
     """
@@ -33,14 +37,15 @@ class Potion:
     def good_hash(cls, potion_name: str, tablesize: int) -> int:
         """
             A good hash function results in few collisions
+            The name is hashed byte by byte from its UTF-8 encoding, so the loop works on
+            ints directly (the same values as ord() for ASCII names).
             :complexity: O(n) where n is the length of the potion's name
         """
         value = 0
-        noise = largest_prime(1000)
-        hash_base = largest_prime(5000)
-        for char in potion_name:
-            value = (ord(char) + value*noise) % tablesize
-            noise = (noise * hash_base) % (tablesize - 1) # changes for each position pseudo randomly
+        noise = GOOD_HASH_NOISE
+        for byte in potion_name.encode('utf-8'):
+            value = (byte + value*noise) % tablesize
+            noise = (noise * GOOD_HASH_BASE) % (tablesize - 1) # changes for each position pseudo randomly
         return value
 
     @classmethod
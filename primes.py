@@ -4,34 +4,116 @@ __author__ = 'Ze Chong, Daniel Ding and Maily Butel'
 
 import math
 
+# Sieve shared by every call to largest_prime, so that repeated calls do not sieve again.
+# Only odd numbers are stored, since 2 is the only even prime: _sieve[j] is 1 when 2 * j + 1 is prime
+# and 0 otherwise, for every odd 2 * j + 1 < _sieved_upto.
+_sieve = bytearray(1)
+_sieved_upto = 2
+
+# Number of odd numbers sieved at a time when the sieve grows. Each segment (128KB) fits in the
+# L2 cache, so every prime's strikes over it hit the cache instead of streaming the whole sieve.
+SIEVE_SEGMENT_SIZE = 1 << 17
+
+# Answers for small k, filled in at the end of the module (empty while it is being built)
+_largest_prime_below = ()
+
+
+def _extend_sieve(k: int) -> None:
+    """
+    Grows the shared sieve so that it covers every number less than k.
+    The sieve at least doubles in size each time it grows, so the sieving cost is amortised over calls.
+    Only the new numbers are sieved, one segment at a time, using the primes up to the square root of
+    the new size (which are made available first if the sieve does not reach them yet).
+    :complexity: O(n log log n) where n is the new size of the sieve
+    """
+    global _sieve, _sieved_upto
+
+    n = max(k, 2 * _sieved_upto)
+
+    # every odd composite below n has an odd prime factor no greater than the integer square root of n,
+    # so make sure the sieve already reaches every odd number up to it
+    root = math.isqrt(n)
+    last = (root - 1) // 2
+    if last >= len(_sieve):
+        _extend_sieve(root + 1)
+    small_primes = [2 * j + 1 for j in range(1, last + 1) if _sieve[j]]
+
+    # array of bytes to keep track of which odd numbers are prime, one byte per odd number below n
+    # 0 = not prime, 1 = prime
+    is_prime = _sieve
+    size = n // 2
+    for lo in range(len(is_prime), size, SIEVE_SEGMENT_SIZE):
+        hi = min(lo + SIEVE_SEGMENT_SIZE, size)
+        segment = bytearray(b'\x01') * (hi - lo)
+        for p in small_primes:
+            # The odd multiples of p from p * p are p entries apart in the sieve, starting at p * p // 2.
+            # Turn off the ones inside this segment in a single slice assignment.
+            start = p * p // 2
+            if start >= hi:
+                break  # the same holds for every larger prime
+            if start < lo:
+                start += (lo - start + p - 1) // p * p
+            segment[start - lo::p] = bytes(len(range(start - lo, hi - lo, p)))
+        is_prime += segment
+
+    _sieve = is_prime
+    _sieved_upto = n
+
 
 def largest_prime(k: int) -> int:
     """
     Finds the largest prime number less than k.
     :pre: k > 2
-    :complexity: O(n log log n)
+    :complexity: O(1) when k < SMALL_PRIME_LIMIT,
+                 O(n log log n) when the sieve has to grow to n,
+                 otherwise O(g) where g is the gap between k and the prime below it
     """
 
     # 2 is the smallest prime number so k must be >2
     if k <= 2:
         raise ValueError("Integer must be greater than 1")
 
-    # array of boolean values to keep track of primes
-    # 0 = not prime, 1 = prime
-    is_prime = [True for i in range(k)]
-
-    # 0 and 1 are not primes
-    is_prime[0] = False
-    is_prime[1] = False
-
-    # go through the array until the square root of k
-    for i in range(int(math.sqrt(k))):
-        # If the element is a prime, turn off all multiples of it
-        if is_prime[i]:
-            for j in range(i ** 2, k, i):
-                is_prime[j] = False
-
-    # Go backwards through the array and return the first prime found.
-    for i in range(len(is_prime) - 1, -1, -1):
-        if is_prime[i]:
-            return i
+    if k < len(_largest_prime_below):
+        return _largest_prime_below[k]
+
+    if k > _sieved_upto:
+        _extend_sieve(k)
+
+    # Search backwards through the odd numbers below k (excluding 1) for the first prime.
+    # rfind does the scan in C and returns -1 when there is none.
+    j = _sieve.rfind(1, 1, (k - 2) // 2 + 1)
+    if j != -1:
+        return 2 * j + 1
+
+    # no odd prime below k, so k is 3
+    return 2
+
+
+def smallest_prime(k: int) -> int:
+    """
+    Finds the smallest prime number greater than or equal to k.
+    :complexity: O(n log log n) when the sieve has to grow to n,
+                 otherwise O(g) where g is the gap between k and the prime at or above it
+    """
+
+    # 2 is the smallest prime number
+    if k <= 2:
+        return 2
+
+    if k >= _sieved_upto:
+        _extend_sieve(k + 1)
+
+    # Search forwards through the odd numbers from k for the first prime, growing the sieve until one is found.
+    # k // 2 is the entry of k when k is odd, and of k + 1 when k is even.
+    j = _sieve.find(1, k // 2)
+    while j == -1:
+        searched = len(_sieve)
+        _extend_sieve(2 * _sieved_upto)
+        j = _sieve.find(1, searched)
+    return 2 * j + 1
+
+
+# Small values of k (such as the default hash table sizes) are answered from a table built once at import.
+# _largest_prime_below[k] is the largest prime less than k, for 2 < k < SMALL_PRIME_LIMIT.
+SMALL_PRIME_LIMIT = 1024
+_largest_prime_below = (0, 0, 0) + tuple(largest_prime(k) for k in range(3, SMALL_PRIME_LIMIT))
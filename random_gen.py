@@ -4,6 +4,12 @@ __author__ = 'Ze Chong, Daniel Ding and Maily Butel'
 
 from typing import Generator
 
+# Parameters of the linear congruential generator used by RandomGen.
+# The modulus is 2^32, so reducing modulo it is the same as masking the low 32 bits.
+LCG_MULTIPLIER = 134775813
+LCG_INCREMENT = 1
+LCG_MASK = 0xFFFFFFFF
+
 
 def lcg(modulus: int, a: int, c: int, seed: int) -> Generator[int, None, None]:
     """Linear congruential generator."""
@@ -12,6 +18,32 @@ def lcg(modulus: int, a: int, c: int, seed: int) -> Generator[int, None, None]:
         yield seed
 
 
+def _next_random(state: int) -> tuple[int, int]:
+    """
+    Advances the generator from state by 5 steps and combines the 16 most significant bits of the 5 values,
+    setting each bit that is set in at least 3 of them.
+    :return: a tuple of (new state, combined 16 bit number)
+    :complexity: O(1)
+    """
+    # Get 5 random values, removing the 16 least significant bits of each
+    state = (LCG_MULTIPLIER * state + LCG_INCREMENT) & LCG_MASK
+    a = state >> 16
+    state = (LCG_MULTIPLIER * state + LCG_INCREMENT) & LCG_MASK
+    b = state >> 16
+    state = (LCG_MULTIPLIER * state + LCG_INCREMENT) & LCG_MASK
+    c = state >> 16
+    state = (LCG_MULTIPLIER * state + LCG_INCREMENT) & LCG_MASK
+    d = state >> 16
+    state = (LCG_MULTIPLIER * state + LCG_INCREMENT) & LCG_MASK
+    e = state >> 16
+
+    # A bit is set in the result when it is set in at least 3 of the 5 random numbers,
+    # i.e. when some 3 of them all have it set. This checks all 16 bits at once.
+    new_num = (a & b & c) | (a & b & d) | (a & b & e) | (a & c & d) | (a & c & e) \
+        | (a & d & e) | (b & c & d) | (b & c & e) | (b & d & e) | (c & d & e)
+    return state, new_num
+
+
 class RandomGen:
     """
         Random number generator.
@@ -22,47 +54,39 @@ class RandomGen:
             Random number generator initialiser
             :complexity: O(1)
         """
-        # random_gen is the Generator returned from lcg
-        # used to get each random number of randint
-        self.random_gen = lcg(pow(2, 32), 134775813, 1, seed)
+        # state is the last value produced by the linear congruential generator,
+        # advanced inline by _next_random rather than through the lcg generator
+        self.state = seed
 
     def randint(self, k: int) -> int:
         """
         Generates a new random number less than k.
 
         :complexity: O(1) for best and worst case since it always generates 5 random numbers
-            and iterates through their 16 most significant bits. Does not depend on value of k.
+            and combines their 16 most significant bits with a fixed number of bitwise operations.
+            Does not depend on value of k.
+        """
+        self.state, new_num = _next_random(self.state)
+
+        # return the result modulo k + 1
+        return (new_num % k) + 1
+
+    def randint_batch(self, n: int, k: int) -> list[int]:
+        """
+        Generates n new random numbers less than k, the same numbers that n calls to randint(k) would give.
+        The generator state is kept in a local variable for the whole batch.
+
+        :complexity: O(n) for best and worst case, see randint
         """
+        state = self.state
+        new_nums = []
+        for _ in range(n):
+            state, new_num = _next_random(state)
+            # store the result modulo k + 1
+            new_nums.append((new_num % k) + 1)
+        self.state = state
 
-        # Get 5 random values and store then in an array
-        rands = []
-        for i in range(5):
-            rand = int(next(self.random_gen))
-            # remove 16 least significant bits
-            rands.append(rand >> 16)
-
-        # Compare each bit in the 5 random numbers and store the result in a string
-        new_num = ''
-        for i in range(16):
-            # counter keeps track of how many of the 5 random numbers have a 1 in the current bit
-            counter = 0
-            for i in range(len(rands)):
-                # Divide by 2 to check if 0 or 1 and increment counter if 1.
-                if rands[i] % 2 == 1:
-                    counter += 1
-                # Right shift to remove last bit
-                rands[i] = rands[i] >> 1
-            # update string based on counter
-            if counter >= 3:
-                new_num = str(1) + new_num
-            else:
-                new_num = str(0) + new_num
-
-        # convert string to int and return it modulo k + 1
-        new_num = int(new_num, base=2)
-        new_num = (new_num % k) + 1
-
-        return new_num
+        return new_nums
 
 
 if __name__ == "__main__":
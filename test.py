@@ -5,11 +5,12 @@
 # print(new_list)
 from hash_table import LinearProbePotionTable
 
+keys = list(map(str, range(100)))
 for i in range (3, 100):
     bad_hash_table = LinearProbePotionTable(i, False)
     good_hash_table = LinearProbePotionTable(i, True)
     for j in range(i):
-        bad_hash_table.insert(str(j), j)
-        good_hash_table.insert(str(j), j)
+        bad_hash_table.insert(keys[j], j)
+        good_hash_table.insert(keys[j], j)
     print(str(i) + ": " + str(bad_hash_table.statistics()))
     print(str(i) + ": " + str(good_hash_table.statistics()))
\ No newline at end of file
@@ -60,6 +60,56 @@ class TestAVL(unittest.TestCase):
         self.b[22] = "H"
         self.assertEqual([self.b.kth_largest(x).key for x in range(1, 9)], [22, 20, 17, 15, 10, 5, 4, 3])
 
+    def test_build_from_sorted(self):
+        self.b = AVLTree()
+        self.b.build_from_sorted([(x, str(x)) for x in range(1, 8)])
+        """
+        4
+        ╟─2
+        ║ ╟─1
+        ║ ╙─3
+        ╙─6
+          ╟─5
+          ╙─7
+        """
+        self.assertEqual(len(self.b), 7)
+        self.assertEqual(self.b.root.key, 4)
+        self.assertEqual(self.b.root.height, 3)
+        self.assertEqual(self.b.root.left.key, 2)
+        self.assertEqual(self.b.root.right.key, 6)
+        self.assertEqual([self.b.kth_largest(x).key for x in range(1, 8)], [7, 6, 5, 4, 3, 2, 1])
+        # The built tree behaves like any other AVL tree afterwards
+        self.b[8] = "8"
+        del self.b[4]
+        self.assertEqual([self.b.kth_largest(x).key for x in range(1, 8)], [8, 7, 6, 5, 3, 2, 1])
+        with self.assertRaises(ValueError):
+            self.b.build_from_sorted([(1, "A"), (1, "B")])
+
+    def test_bulk_insert(self):
+        self.b = AVLTree()
+        self.b[15] = "A"
+        self.b[10] = "B"
+        # Large batch: the tree is rebuilt from all the keys
+        self.b.bulk_insert([(20, "C"), (17, "D"), (5, "E"), (3, "F")])
+        self.assertEqual(len(self.b), 6)
+        self.assertEqual([self.b.kth_largest(x).key for x in range(1, 7)], [20, 17, 15, 10, 5, 3])
+        self.assertEqual(self.b[17], "D")
+        # Small batch: inserted one at a time
+        self.b.bulk_insert([(4, "G"), (22, "H")])
+        self.assertEqual([self.b.kth_largest(x).key for x in range(1, 9)], [22, 20, 17, 15, 10, 5, 4, 3])
+        # A repeated key is rejected and leaves the tree untouched
+        with self.assertRaises(ValueError):
+            self.b.bulk_insert([(x, "X") for x in range(30, 40)] + [(15, "X")])
+        self.assertEqual(len(self.b), 8)
+        self.assertEqual(self.b[15], "A")
+        # The same holds for small batches, whether the key is already in the tree or repeated in the batch
+        for pairs in ([(1, "X"), (15, "X")], [(1, "X"), (2, "X"), (1, "Y")]):
+            with self.assertRaises(ValueError):
+                self.b.bulk_insert(pairs)
+            self.assertEqual(len(self.b), 8)
+            self.assertFalse(1 in self.b)
+            self.assertEqual([self.b.kth_largest(x).key for x in range(1, 9)], [22, 20, 17, 15, 10, 5, 4, 3])
+
 if __name__ == '__main__':
     suite = unittest.TestLoader().loadTestsFromTestCase(TestAVL)
     unittest.TextTestRunner(verbosity=0).run(suite)
@@ -40,6 +40,18 @@ class TestBST(unittest.TestCase):
         self.assertEqual(self.b.get_successor(self.b.get_tree_node_by_key(15)).item, "D")
         self.assertEqual(self.b.get_successor(self.b.get_tree_node_by_key(5)), None)
 
+    def test_clear(self):
+        node = self.b.get_tree_node_by_key(15)
+        self.b.clear()
+        self.assertTrue(self.b.is_empty())
+        self.assertEqual(len(self.b), 0)
+        self.assertFalse(15 in self.b)
+        self.assertIsNone(node.left)
+        self.assertIsNone(node.right)
+        # The tree can be reused afterwards
+        self.b[1] = "A"
+        self.assertEqual(self.b[1], "A")
+
 if __name__ == '__main__':
     suite = unittest.TestLoader().loadTestsFromTestCase(TestBST)
     unittest.TextTestRunner(verbosity=0).run(suite)
@@ -24,6 +24,17 @@ class TestGame(unittest.TestCase):
         # Vendor Selection gives unique results
         self.assertTrue(len(set(res)) == len(set(res2)) == 99)
 
+    def test_choose_vendors_order(self):
+        # Each vendor takes the pth most expensive of the potions not chosen yet.
+        # Expected values come from choosing by deleting potions from the inventory and re-adding them.
+        g = Game(seed=7)
+        g.set_total_potion_data([(str(x), "P" + str(x), x) for x in range(1, 13)])
+        g.add_potions_to_inventory([("P" + str(x), x) for x in range(1, 13)])
+        self.assertEqual([p[0] for p in g.choose_potions_for_vendors(5)], ["P7", "P1", "P11", "P5", "P12"])
+        self.assertEqual([p[0] for p in g.choose_potions_for_vendors(5)], ["P12", "P8", "P4", "P2", "P1"])
+        self.assertEqual([p[0] for p in g.choose_potions_for_vendors(12)],
+                         ["P9", "P5", "P2", "P1", "P7", "P11", "P8", "P3", "P4", "P12", "P10", "P6"])
+
     def test_example(self):
         G = Game()
         # There are these potions, with these stats, available over the course of the game.
@@ -58,6 +69,16 @@ class TestGame(unittest.TestCase):
         results = G.solve_game(full_vendor_info, [12.5, 45, 80])
         self.assertEqual(results, [37.5, 90, 142.5])
 
+        # The trades need 15 and then 145 in total. Check no money, exactly enough to finish
+        # the first trade or every trade, just past the first trade, and more than can be spent.
+        results = G.solve_game(full_vendor_info, [0, 15, 145, 15.5, 200])
+        self.assertEqual(results, [0, 45, 240, 45.75, 295])
+
+        # No profitable trades (or no trades at all) means the money is kept
+        results = G.solve_game([("Potion of Increased Stamina", 20), ("Potion of Extreme Speed", 10)], [0, 50])
+        self.assertEqual(results, [0, 50])
+        self.assertEqual(G.solve_game([], [30]), [30])
+
 if __name__ == '__main__':
     suite = unittest.TestLoader().loadTestsFromTestCase(TestGame)
     unittest.TextTestRunner(verbosity=0).run(suite)
@@ -11,6 +11,13 @@ class TestTable(unittest.TestCase):
         self.assertEqual(len(c1.table), 120)
         # Should at least accomodate all positions.
         self.assertGreaterEqual(len(c2.table), 100)
+
+    def test_load_factor(self):
+        # Default sizes should keep a full table within the target load factor.
+        for max_potions in range(1, 200):
+            table = LinearProbePotionTable(max_potions)
+            self.assertLessEqual(max_potions / table.table_size, LinearProbePotionTable.TARGET_LOAD)
+        self.assertEqual(LinearProbePotionTable(7).table_size, 11)
     
     def test_stats(self):
         # Using a dictionary in the tester file for hash table ;)
@@ -1,6 +1,6 @@
 import unittest
 
-from primes import largest_prime
+from primes import largest_prime, smallest_prime
 
 class TestPrimes(unittest.TestCase):
     
@@ -10,6 +10,19 @@ class TestPrimes(unittest.TestCase):
         for i, o in zip(inputs, outputs):
             self.assertEqual(largest_prime(i), o)
 
+    def test_smallest_prime(self):
+        inputs = [0, 2, 3, 8, 10, 24, 90]
+        outputs = [2, 2, 3, 11, 11, 29, 97]
+        for i, o in zip(inputs, outputs):
+            self.assertEqual(smallest_prime(i), o)
+
+    def test_square_of_prime(self):
+        # the square root itself must be sieved, otherwise p*p is reported as prime
+        inputs = [5, 10, 26, 50]
+        outputs = [3, 7, 23, 47]
+        for i, o in zip(inputs, outputs):
+            self.assertEqual(largest_prime(i), o)
+
 if __name__ == '__main__':
     suite = unittest.TestLoader().loadTestsFromTestCase(TestPrimes)
     unittest.TextTestRunner(verbosity=0).run(suite)
@@ -12,6 +12,16 @@ class TestRandom(unittest.TestCase):
         r = RandomGen(seed=25)
         self.assertEqual(r.randint(100), 69)
 
+    def test_randint_batch(self):
+        r = RandomGen(seed=0)
+        self.assertEqual(r.randint_batch(2, 100), [77, 30])
+        # the batch continues the same sequence as randint
+        single = RandomGen(seed=25)
+        batch = RandomGen(seed=25)
+        self.assertEqual(batch.randint_batch(50, 7), [single.randint(7) for _ in range(50)])
+        self.assertEqual(batch.randint(1000), single.randint(1000))
+        self.assertEqual(batch.randint_batch(0, 10), [])
+
 
 if __name__ == '__main__':
     suite = unittest.TestLoader().loadTestsFromTestCase(TestRandom)